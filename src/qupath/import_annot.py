@@ -6,16 +6,50 @@ and mapping them to image tiles for training.
 """
 
 import json
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import logging
-from shapely.geometry import shape, Point, Polygon
+from concurrent.futures import ThreadPoolExecutor
+import shapely
+from shapely.geometry import shape
 from shapely.ops import unary_union
 
+try:
+    import ijson
+except ImportError:  # Optional: stream large GeoJSON exports
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster whole-document JSON parsing
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional: multithreaded CSV parsing
+    pyarrow = None
+
 logger = logging.getLogger(__name__)
 
+# QuPath properties that are parsed explicitly rather than copied through
+RESERVED_PROPERTIES = frozenset({'classification', 'objectType', 'name'})
+
+# Number of consecutive tiles whose candidate pairs are processed together
+TILE_BLOCK_SIZE = 256
+
+# Annotations with more vertices than this are split along a coarse grid
+MAX_ANNOTATION_VERTICES = 512
+SUBDIVIDE_GRID_SIZE = 1024
+
+# Narrow dtypes for known tile manifest columns (others are inferred)
+TILE_MANIFEST_DTYPES = {'tissue_ratio': 'float32'}
+
+# Tile coordinate columns stored as int32 when they hold whole numbers
+TILE_COORD_COLUMNS = ('x', 'y', 'width', 'height')
+
 
 def load_geojson(geojson_path: Path) -> Dict:
     """
@@ -27,8 +61,12 @@ def load_geojson(geojson_path: Path) -> Dict:
     Returns:
         Dictionary with GeoJSON data
     """
-    with open(geojson_path, 'r') as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(geojson_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(geojson_path, 'r') as f:
+            data = json.load(f)
     
     logger.info(f"Loaded GeoJSON from {geojson_path}")
     logger.info(f"Features: {len(data.get('features', []))}")
@@ -36,6 +74,71 @@ def load_geojson(geojson_path: Path) -> Dict:
     return data
 
 
+def iter_features(geojson_path: Path) -> Iterator[Dict]:
+    """
+    Iterate over the features of a QuPath GeoJSON file.
+    
+    Uses ijson (if installed) to stream features one at a time, so
+    whole-slide exports never have to be held in memory as a single dict.
+    Falls back to load_geojson otherwise.
+    
+    Args:
+        geojson_path: Path to GeoJSON file
+        
+    Yields:
+        GeoJSON feature dictionaries
+    """
+    if ijson is None:
+        yield from load_geojson(geojson_path).get('features', [])
+        return
+    
+    logger.info(f"Streaming GeoJSON features from {geojson_path}")
+    with open(geojson_path, 'rb') as f:
+        yield from ijson.items(f, 'features.item', use_float=True)
+
+
+def _scan_geojson_header(geojson_path: Path, n_features: int = 5) -> Dict:
+    """
+    Stream the top-level structure of a GeoJSON file with ijson.
+    
+    Args:
+        geojson_path: Path to GeoJSON file
+        n_features: Number of leading features to collect keys for
+        
+    Returns:
+        Dictionary with 'type' and 'features' (if present), where each
+        feature only holds its top-level keys
+    """
+    header = {}
+    seen = 0
+    with open(geojson_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'type' and event in ('string', 'number', 'null'):
+                header['type'] = value
+            elif prefix == 'features' and event == 'start_array':
+                header['features'] = []
+            elif prefix == 'features.item' and event == 'start_map':
+                seen += 1
+                if seen <= n_features:
+                    header['features'].append({})
+            elif prefix == 'features.item' and event == 'map_key':
+                if seen <= n_features:
+                    header['features'][-1][value] = None
+            elif prefix == 'features.item' and event == 'end_map':
+                # Stop once the sampled features and the type are known
+                if seen >= n_features and 'type' in header:
+                    break
+    
+    return header
+
+
+def _dumps(obj: Dict) -> str:
+    """Serialize a GeoJSON object, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
 def parse_qupath_classification(properties: Dict) -> str:
     """
     Parse classification from QuPath properties.
@@ -62,54 +165,68 @@ def parse_qupath_classification(properties: Dict) -> str:
     return 'Unknown'
 
 
-def geojson_to_dataframe(geojson_data: Dict, coordinate_scale: float = 1.0) -> pd.DataFrame:
+def geojson_to_dataframe(
+    geojson_data: Union[Dict, Iterable[Dict]],
+    coordinate_scale: float = 1.0
+) -> pd.DataFrame:
     """
     Convert GeoJSON features to pandas DataFrame.
     
     Args:
-        geojson_data: GeoJSON dictionary
+        geojson_data: GeoJSON dictionary, or an iterable of features
+            (e.g. from iter_features)
         coordinate_scale: Scale factor for coordinates (microns per pixel)
         
     Returns:
         DataFrame with annotation information
     """
-    features = geojson_data.get('features', [])
+    if isinstance(geojson_data, dict):
+        features = geojson_data.get('features', [])
+    else:
+        features = geojson_data
+    area_scale = coordinate_scale ** 2
     
-    annotations = []
+    classifications = []
+    geometry_types = []
+    geometry_json = []
+    custom_properties = []
     for feature in features:
         geometry = feature.get('geometry', {})
         properties = feature.get('properties', {})
         
         # Parse classification
-        classification = parse_qupath_classification(properties)
-        
-        # Get geometry info
-        geom = shape(geometry)
-        bounds = geom.bounds  # (minx, miny, maxx, maxy)
-        centroid = geom.centroid
-        area = geom.area * (coordinate_scale ** 2)
-        
-        annotation_dict = {
-            'classification': classification,
-            'geometry_type': geometry.get('type'),
-            'x_min': bounds[0],
-            'y_min': bounds[1],
-            'x_max': bounds[2],
-            'y_max': bounds[3],
-            'centroid_x': centroid.x,
-            'centroid_y': centroid.y,
-            'area_um2': area,
-            'geometry': geom
-        }
+        classifications.append(parse_qupath_classification(properties))
+        geometry_types.append(geometry.get('type'))
+        geometry_json.append(_dumps(geometry))
         
         # Add any custom properties
-        for key, value in properties.items():
-            if key not in ['classification', 'objectType', 'name']:
-                annotation_dict[f'property_{key}'] = value
-        
-        annotations.append(annotation_dict)
+        custom_properties.append({
+            f'property_{key}': value
+            for key, value in properties.items()
+            if key not in RESERVED_PROPERTIES
+        })
+    
+    # Get geometry info for all features at once; anything GEOS rejects
+    # (e.g. unclosed rings) goes through shape(), which is more lenient
+    geoms = shapely.from_geojson(np.array(geometry_json, dtype=object), on_invalid='ignore')
+    for idx in np.flatnonzero(shapely.is_missing(geoms)):
+        geoms[idx] = shape(json.loads(geometry_json[idx]))
+    bounds = shapely.bounds(geoms)  # (minx, miny, maxx, maxy)
+    centroids = shapely.centroid(geoms)
     
-    df = pd.DataFrame(annotations)
+    df = pd.DataFrame({
+        'classification': classifications,
+        'geometry_type': geometry_types,
+        'x_min': bounds[:, 0],
+        'y_min': bounds[:, 1],
+        'x_max': bounds[:, 2],
+        'y_max': bounds[:, 3],
+        'centroid_x': shapely.get_x(centroids),
+        'centroid_y': shapely.get_y(centroids),
+        'area_um2': shapely.area(geoms) * area_scale,
+        'geometry': geoms
+    })
+    df = pd.concat([df, pd.DataFrame(custom_properties, index=df.index)], axis=1)
     logger.info(f"Parsed {len(df)} annotations")
     
     if not df.empty:
@@ -118,10 +235,290 @@ def geojson_to_dataframe(geojson_data: Dict, coordinate_scale: float = 1.0) -> p
     return df
 
 
+def _overlay_areas(tile_polys: np.ndarray, annot_geoms: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise intersection areas with the general GEOS overlay.
+    
+    Args:
+        tile_polys: Array of tile polygons
+        annot_geoms: Array of annotation geometries (same length)
+        
+    Returns:
+        Array of intersection areas
+    """
+    try:
+        return shapely.area(shapely.intersection(tile_polys, annot_geoms))
+    except shapely.errors.GEOSException as e:
+        logger.debug(f"Vectorized overlap failed, retrying per pair: {e}")
+    
+    areas = np.zeros(len(tile_polys), dtype=np.float64)
+    for i, (tile_poly, annot_geom) in enumerate(zip(tile_polys, annot_geoms)):
+        try:
+            areas[i] = tile_poly.intersection(annot_geom).area
+        except Exception as e:
+            logger.debug(f"Error calculating overlap: {e}")
+    
+    return areas
+
+
+def _clip_areas(
+    tile_bounds: np.ndarray,
+    t_idx: np.ndarray,
+    annot_geoms: np.ndarray
+) -> np.ndarray:
+    """
+    Compute intersection areas by clipping polygons to their tile rectangle.
+    
+    GEOS rectangle clipping skips the general overlay (noding and robust
+    predicates), which dominates the cost of shapely.intersection. Pairs
+    are grouped by tile so each tile needs a single vectorized call.
+    
+    Args:
+        tile_bounds: Array of (x_min, y_min, x_max, y_max) per tile
+        t_idx: Tile index of each pair
+        annot_geoms: Annotation geometry of each pair (same length)
+        
+    Returns:
+        Array of intersection areas
+    """
+    areas = np.zeros(len(t_idx), dtype=np.float64)
+    if len(t_idx) == 0:
+        return areas
+    
+    order = np.argsort(t_idx, kind='stable')
+    t_sorted = t_idx[order]
+    starts = np.flatnonzero(np.r_[True, t_sorted[1:] != t_sorted[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    
+    for start, end in zip(starts, ends):
+        pairs = order[start:end]
+        x_min, y_min, x_max, y_max = tile_bounds[t_sorted[start]]
+        clipped = shapely.clip_by_rect(annot_geoms[pairs], x_min, y_min, x_max, y_max)
+        areas[pairs] = shapely.area(clipped)
+    
+    return areas
+
+
+def _intersection_areas(
+    tile_bounds: np.ndarray,
+    t_idx: np.ndarray,
+    annot_geoms: np.ndarray
+) -> np.ndarray:
+    """
+    Compute intersection areas between tiles and annotation geometries.
+    
+    Valid hole-free polygons (the usual QuPath follicle outline) are clipped
+    against the tile rectangle; anything else falls back to the overlay,
+    since rectangle clipping gives meaningless areas for invalid input.
+    
+    Args:
+        tile_bounds: Array of (x_min, y_min, x_max, y_max) per tile
+        t_idx: Tile index of each pair
+        annot_geoms: Annotation geometry of each pair (same length)
+        
+    Returns:
+        Array of intersection areas
+    """
+    simple = (
+        (shapely.get_type_id(annot_geoms) == shapely.GeometryType.POLYGON)
+        & (shapely.get_num_interior_rings(annot_geoms) == 0)
+        & shapely.is_valid(annot_geoms)
+    )
+    
+    areas = np.zeros(len(t_idx), dtype=np.float64)
+    areas[simple] = _clip_areas(tile_bounds, t_idx[simple], annot_geoms[simple])
+    
+    if not simple.all():
+        tile_polys = shapely.box(*tile_bounds[t_idx[~simple]].T)
+        areas[~simple] = _overlay_areas(tile_polys, annot_geoms[~simple])
+    
+    return areas
+
+
+def _subdivide_large_geometries(
+    geoms: np.ndarray,
+    max_vertices: int = MAX_ANNOTATION_VERTICES,
+    grid_size: float = SUBDIVIDE_GRID_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split geometries with many vertices into grid-aligned pieces.
+    
+    Large outlines (e.g. tissue regions or follicle clusters) make every
+    clip or intersection O(vertices); cutting them along a coarse grid
+    keeps each piece small and tightens its bounding box in the STRtree.
+    Pieces of one geometry are disjoint, so their areas sum to the original.
+    Invalid geometries are left whole, since clipping them is not
+    area-preserving.
+    
+    Args:
+        geoms: Array of geometries
+        max_vertices: Valid geometries with more coordinates than this are split
+        grid_size: Grid cell size in pixels
+        
+    Returns:
+        Tuple of (pieces, parent index of each piece)
+    """
+    large = (shapely.get_num_coordinates(geoms) > max_vertices) & shapely.is_valid(geoms)
+    if not large.any():
+        return geoms, np.arange(len(geoms))
+    
+    pieces = [geoms[~large]]
+    parents = [np.flatnonzero(~large)]
+    
+    for idx in np.flatnonzero(large):
+        geom = geoms[idx]
+        x_min, y_min, x_max, y_max = geom.bounds
+        cells = np.array([
+            shapely.clip_by_rect(geom, x, y, x + grid_size, y + grid_size)
+            for x in np.arange(np.floor(x_min / grid_size) * grid_size, x_max, grid_size)
+            for y in np.arange(np.floor(y_min / grid_size) * grid_size, y_max, grid_size)
+        ], dtype=object)
+        cells = cells[~shapely.is_empty(cells)]
+        
+        pieces.append(cells)
+        parents.append(np.full(len(cells), idx))
+    
+    logger.debug(f"Subdivided {large.sum()} large annotations into grid pieces")
+    
+    return np.concatenate(pieces), np.concatenate(parents)
+
+
+def _tile_blocks(t_idx: np.ndarray, block_size: int) -> List[np.ndarray]:
+    """
+    Group pair positions into blocks of consecutive tiles.
+    
+    Args:
+        t_idx: Tile index of each pair
+        block_size: Number of tiles per block
+        
+    Returns:
+        List of arrays of pair positions, one per non-empty block
+    """
+    if len(t_idx) == 0:
+        return []
+    
+    order = np.argsort(t_idx, kind='stable')
+    block_ids = t_idx[order] // block_size
+    return np.split(order, np.flatnonzero(np.diff(block_ids)) + 1)
+
+
+def _pair_intersection_areas(
+    tile_bounds: np.ndarray,
+    t_idx: np.ndarray,
+    annot_geoms: np.ndarray,
+    n_jobs: int = 1,
+    block_size: int = TILE_BLOCK_SIZE
+) -> np.ndarray:
+    """
+    Compute pairwise intersection areas block by block.
+    
+    Pairs are processed in blocks of consecutive tiles, so the geometries
+    of one block stay hot in cache and temporaries stay small. Shapely 2
+    releases the GIL inside its vectorized operations, so blocks can run
+    concurrently on threads without pickling any geometries.
+    
+    Args:
+        tile_bounds: Array of (x_min, y_min, x_max, y_max) per tile
+        t_idx: Tile index of each pair
+        annot_geoms: Annotation geometry of each pair (same length)
+        n_jobs: Number of worker threads (-1 uses all CPU cores)
+        block_size: Number of tiles per block
+        
+    Returns:
+        Array of intersection areas
+    """
+    n_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+    areas = np.zeros(len(t_idx), dtype=np.float64)
+    
+    def process_block(block: np.ndarray):
+        areas[block] = _intersection_areas(tile_bounds, t_idx[block], annot_geoms[block])
+    
+    blocks = _tile_blocks(t_idx, block_size)
+    if n_workers == 1 or len(blocks) < 2:
+        for block in blocks:
+            process_block(block)
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(process_block, blocks))
+    
+    return areas
+
+
+def _union_geometries(geoms: np.ndarray):
+    """
+    Union geometries, preferring the linear-time coverage union.
+    
+    QuPath annotations of one class rarely overlap, which is exactly the
+    case GEOS coverage union handles without the general overlay. Inputs
+    that do overlap give an invalid coverage result (or an error), and are
+    unioned with unary_union instead.
+    
+    Args:
+        geoms: Array of geometries
+        
+    Returns:
+        Unioned geometry
+    """
+    try:
+        merged = shapely.coverage_union_all(geoms)
+        if shapely.is_valid(merged):
+            return merged
+    except shapely.errors.GEOSException as e:
+        logger.debug(f"Coverage union failed, using unary_union: {e}")
+    
+    return unary_union(geoms)
+
+
+def merge_annotations_by_class(annotations_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Union all annotation geometries that share a classification.
+    
+    Invalid (e.g. self-intersecting) outlines cannot be unioned, so they
+    are kept as separate, unmerged entries, as are the annotations of any
+    class whose union fails. Missing classifications form their own group.
+    
+    Args:
+        annotations_df: DataFrame with annotation geometries
+        
+    Returns:
+        Tuple of (geometries, classifications): merged classes in order of
+        first appearance, followed by any unmerged annotations
+    """
+    annotations_df = annotations_df.reset_index(drop=True)
+    geoms = annotations_df['geometry'].to_numpy()
+    classes = annotations_df['classification'].to_numpy(dtype=object)
+    valid = shapely.is_valid(geoms)
+    
+    merged_geoms, merged_classes = [], []
+    unmerged = [np.flatnonzero(~valid)]
+    for classification, group in annotations_df[valid].groupby(
+        'classification', sort=False, dropna=False
+    )['geometry']:
+        try:
+            merged_geoms.append(_union_geometries(group.to_numpy()))
+            merged_classes.append(classification)
+        except shapely.errors.GEOSException as e:
+            logger.warning(f"Could not merge '{classification}' annotations, keeping them separate: {e}")
+            unmerged.append(group.index.to_numpy())
+    
+    unmerged = np.sort(np.concatenate(unmerged))
+    if len(unmerged):
+        logger.warning(f"Keeping {len(unmerged)} invalid or unmergeable annotations unmerged")
+    logger.info(f"Merged {len(annotations_df)} annotations into {len(merged_geoms)} class geometries")
+    
+    return (
+        np.concatenate([np.array(merged_geoms, dtype=object), geoms[unmerged]]),
+        np.concatenate([np.array(merged_classes, dtype=object), classes[unmerged]])
+    )
+
+
 def map_annotations_to_tiles(
     annotations_df: pd.DataFrame,
     tiles_manifest: pd.DataFrame,
-    overlap_threshold: float = 0.5
+    overlap_threshold: float = 0.5,
+    n_jobs: int = 1,
+    merge_by_class: bool = False,
+    min_tissue_ratio: Optional[float] = 0.05
 ) -> pd.DataFrame:
     """
     Map annotations to image tiles based on spatial overlap.
@@ -130,49 +527,119 @@ def map_annotations_to_tiles(
         annotations_df: DataFrame with annotation geometries
         tiles_manifest: DataFrame with tile information (x, y, width, height)
         overlap_threshold: Minimum overlap ratio to assign label (0-1)
+        n_jobs: Number of threads for overlap computation (-1 uses all cores)
+        merge_by_class: Union annotations of the same class first, so each
+            tile is intersected with at most one geometry per class. The
+            confidence then becomes the tile's overlap with all annotations
+            of that class combined rather than with the single best one.
+        min_tissue_ratio: Tiles with tissue_ratio at or below this are
+            labeled 'background' without any geometry work (None disables)
         
     Returns:
         Updated tiles_manifest with label column
     """
     logger.info(f"Mapping {len(annotations_df)} annotations to {len(tiles_manifest)} tiles")
     
-    # Initialize label column
-    tiles_manifest['label'] = 'background'
-    tiles_manifest['label_confidence'] = 0.0
-    
-    for tile_idx, tile_row in tiles_manifest.iterrows():
-        # Create tile polygon
-        tile_poly = Polygon([
-            (tile_row['x'], tile_row['y']),
-            (tile_row['x'] + tile_row['width'], tile_row['y']),
-            (tile_row['x'] + tile_row['width'], tile_row['y'] + tile_row['height']),
-            (tile_row['x'], tile_row['y'] + tile_row['height'])
-        ])
+    n_tiles = len(tiles_manifest)
+    best_overlap = np.zeros(n_tiles, dtype=np.float64)
+    best_cls = np.empty(n_tiles, dtype=object)
+    best_cls[:] = 'background'
+    
+    # Tiles with (almost) no tissue cannot carry an annotation
+    if min_tissue_ratio is not None and 'tissue_ratio' in tiles_manifest.columns:
+        tile_rows = np.flatnonzero(tiles_manifest['tissue_ratio'].to_numpy() > min_tissue_ratio)
+        logger.info(f"Skipping {n_tiles - len(tile_rows)} tiles with tissue_ratio <= {min_tissue_ratio}")
+    else:
+        tile_rows = np.arange(n_tiles)
+    
+    if len(tile_rows) > 0 and not annotations_df.empty:
+        # Work on raw column arrays instead of DataFrame rows
+        xs, ys, ws, hs = (
+            tiles_manifest[c].to_numpy(dtype=np.float64)[tile_rows]
+            for c in ('x', 'y', 'width', 'height')
+        )
+        tile_areas = ws * hs
+    
+        # Build all tile polygons in one shot
+        x1, y1 = xs + ws, ys + hs
+        corners = np.stack([
+            np.stack([xs, ys], axis=1),
+            np.stack([x1, ys], axis=1),
+            np.stack([x1, y1], axis=1),
+            np.stack([xs, y1], axis=1),
+        ], axis=1)
+        tile_polys = shapely.polygons(corners)
+        tile_bounds = np.stack([xs, ys, x1, y1], axis=1)
+    
+        if merge_by_class:
+            annot_geoms, annot_classes = merge_annotations_by_class(annotations_df)
+        else:
+            annot_geoms = annotations_df['geometry'].to_numpy()
+            annot_classes = annotations_df['classification'].to_numpy()
+        n_annots = len(annot_geoms)
         
-        tile_area = tile_poly.area
-        best_overlap = 0.0
-        best_classification = 'background'
+        # Split very complex outlines into grid pieces; each piece keeps
+        # the index of the annotation it came from
+        pieces, parents = _subdivide_large_geometries(annot_geoms)
         
-        # Find annotation with highest overlap
-        for _, annot in annotations_df.iterrows():
-            annot_geom = annot['geometry']
-            
-            # Calculate overlap
-            try:
-                intersection = tile_poly.intersection(annot_geom)
-                overlap_ratio = intersection.area / tile_area
-                
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_classification = annot['classification']
-            except Exception as e:
-                logger.debug(f"Error calculating overlap: {e}")
-                continue
+        # Each geometry is tested against many tiles, so cache its GEOS
+        # prepared (indexed) representation once up front
+        shapely.prepare(annot_geoms)
+        shapely.prepare(pieces)
+        annot_valid = shapely.is_valid(annot_geoms)
+    
+        # Prune (tile, piece) pairs with a spatial index; the query only
+        # compares envelopes, so GEOS is never invoked to find a zero
+        tree = shapely.STRtree(pieces)
+        t_idx, p_idx = tree.query(tile_polys)
+    
+        # Drop pairs whose bounding boxes merely touch (zero-area overlap)
+        piece_bounds = shapely.bounds(pieces)
+        pb = piece_bounds[p_idx]
+        keep = (
+            (np.minimum(x1[t_idx], pb[:, 2]) > np.maximum(xs[t_idx], pb[:, 0]))
+            & (np.minimum(y1[t_idx], pb[:, 3]) > np.maximum(ys[t_idx], pb[:, 1]))
+        )
+        t_idx, p_idx = t_idx[keep], p_idx[keep]
+    
+        # Tiles lying entirely inside a valid annotation already have the
+        # maximum overlap, so only the covering pairs are kept for them and
+        # every other tile goes through the full intersection
+        covered = shapely.covers(annot_geoms[parents[p_idx]], tile_polys[t_idx])
+        covered &= annot_valid[parents[p_idx]]
+        tile_covered = np.zeros(len(tile_rows), dtype=bool)
+        tile_covered[t_idx[covered]] = True
+        partial = ~tile_covered[t_idx]
+        
+        overlaps = np.zeros(len(t_idx), dtype=np.float64)
+        overlaps[partial] = _pair_intersection_areas(
+            tile_bounds, t_idx[partial], pieces[p_idx[partial]], n_jobs
+        ) / tile_areas[t_idx[partial]]
         
-        # Assign label if overlap exceeds threshold
-        if best_overlap >= overlap_threshold:
-            tiles_manifest.at[tile_idx, 'label'] = best_classification
-            tiles_manifest.at[tile_idx, 'label_confidence'] = best_overlap
+        keep = covered | partial
+        t_idx, p_idx = t_idx[keep], p_idx[keep]
+        covered, overlaps = covered[keep], overlaps[keep]
+        
+        # Pieces of one annotation are disjoint, so their overlaps add up
+        pair_keys, inverse = np.unique(
+            t_idx * n_annots + parents[p_idx], return_inverse=True
+        )
+        overlaps = np.bincount(inverse, weights=overlaps, minlength=len(pair_keys))
+        overlaps[np.bincount(inverse, weights=covered, minlength=len(pair_keys)) > 0] = 1.0
+        t_idx, a_idx = pair_keys // n_annots, pair_keys % n_annots
+    
+        # Highest overlap per tile; ties go to the earliest annotation
+        order = np.lexsort((a_idx, -overlaps, t_idx))
+        best = order[np.unique(t_idx[order], return_index=True)[1]]
+        best = best[overlaps[best] > 0]
+    
+        best_overlap[tile_rows[t_idx[best]]] = overlaps[best]
+        best_cls[tile_rows[t_idx[best]]] = annot_classes[a_idx[best]]
+    
+    # Assign label if overlap exceeds threshold
+    assign = best_overlap >= overlap_threshold
+    tiles_manifest['label'] = np.where(assign, best_cls, 'background')
+    tiles_manifest['label_confidence'] = np.where(assign, best_overlap, 0.0)
     
     # Log label distribution
     label_counts = tiles_manifest['label'].value_counts()
@@ -188,7 +655,10 @@ def import_qupath_annotations(
     tiles_manifest_path: Path,
     species: str,
     coordinate_scale: float = 1.0,
-    overlap_threshold: float = 0.5
+    overlap_threshold: float = 0.5,
+    n_jobs: int = 1,
+    merge_by_class: bool = False,
+    min_tissue_ratio: Optional[float] = 0.05
 ) -> pd.DataFrame:
     """
     Complete workflow to import QuPath annotations and map to tiles.
@@ -199,40 +669,53 @@ def import_qupath_annotations(
         species: Species code (for validation)
         coordinate_scale: Microns per pixel
         overlap_threshold: Minimum overlap to assign label
+        n_jobs: Number of threads for overlap computation (-1 uses all cores)
+        merge_by_class: Union same-class annotations before mapping
+        min_tissue_ratio: Skip tiles at or below this tissue_ratio (None disables)
         
     Returns:
         Updated tiles manifest with labels
     """
     logger.info(f"Importing QuPath annotations for {species}")
     
-    # Load GeoJSON
-    geojson_data = load_geojson(geojson_path)
-    
-    # Parse to DataFrame
-    annotations_df = geojson_to_dataframe(geojson_data, coordinate_scale)
+    # Stream GeoJSON features into a DataFrame
+    annotations_df = geojson_to_dataframe(iter_features(geojson_path), coordinate_scale)
     
     # Load tiles manifest
-    tiles_manifest = pd.read_csv(tiles_manifest_path)
+    read_kwargs = {'dtype': TILE_MANIFEST_DTYPES}
+    if pyarrow is not None:
+        read_kwargs['engine'] = 'pyarrow'
+    tiles_manifest = pd.read_csv(tiles_manifest_path, **read_kwargs)
+    
+    # Narrow integer coordinates after parsing so fractional values are kept
+    # as floats regardless of the CSV engine
+    int32_info = np.iinfo(np.int32)
+    for col in TILE_COORD_COLUMNS:
+        if col in tiles_manifest.columns and pd.api.types.is_integer_dtype(tiles_manifest[col]):
+            if tiles_manifest[col].between(int32_info.min, int32_info.max).all():
+                tiles_manifest[col] = tiles_manifest[col].astype('int32')
     logger.info(f"Loaded {len(tiles_manifest)} tiles from manifest")
     
     # Map annotations to tiles
     labeled_tiles = map_annotations_to_tiles(
         annotations_df,
         tiles_manifest,
-        overlap_threshold
+        overlap_threshold,
+        n_jobs,
+        merge_by_class,
+        min_tissue_ratio
     )
     
     # Validate classifications for species
-    from species.registry import get_species_info
-    species_info = get_species_info(species)
+    from species.registry import get_valid_labels
+    valid_labels = get_valid_labels(species)
     
-    if species_info:
-        valid_types = species_info.typical_follicle_types + ['background']
-        invalid_labels = set(labeled_tiles['label'].unique()) - set(valid_types)
+    if valid_labels:
+        invalid_labels = set(labeled_tiles['label'].unique()) - valid_labels
         
         if invalid_labels:
             logger.warning(f"Found invalid labels for {species}: {invalid_labels}")
-            logger.warning(f"Valid labels: {valid_types}")
+            logger.warning(f"Valid labels: {sorted(valid_labels)}")
     
     return labeled_tiles
 
@@ -248,7 +731,10 @@ def validate_geojson(geojson_path: Path) -> bool:
         True if valid, False otherwise
     """
     try:
-        data = load_geojson(geojson_path)
+        if ijson is not None:
+            data = _scan_geojson_header(geojson_path)
+        else:
+            data = load_geojson(geojson_path)
         
         # Check required fields
         if 'type' not in data:
@@ -288,25 +774,39 @@ def export_tile_labels_for_review(
     """
     Export sample of labeled tiles for manual review.
     
+    The format follows the file extension: '.feather' or '.parquet' are
+    written as columnar binary files (requires pyarrow), anything else as CSV.
+    
     Args:
         labeled_tiles: DataFrame with tile labels
         output_path: Path to save review file
         sample_size: Number of tiles to sample
     """
-    # Sample tiles
-    if len(labeled_tiles) > sample_size:
-        sample = labeled_tiles.sample(n=sample_size, random_state=42)
-    else:
-        sample = labeled_tiles
-    
     # Select relevant columns
     review_cols = ['tile_id', 'tile_path', 'label', 'label_confidence', 
                    'x', 'y', 'tissue_ratio']
-    review_df = sample[review_cols].copy()
+    missing_cols = set(review_cols) - set(labeled_tiles.columns)
+    if missing_cols:
+        raise KeyError(f"Labeled tiles missing review columns: {sorted(missing_cols)}")
+    col_idx = labeled_tiles.columns.get_indexer(review_cols)
+    
+    # Sample tile positions, copying only the review columns
+    if len(labeled_tiles) > sample_size:
+        rng = np.random.default_rng(42)
+        row_idx = rng.choice(len(labeled_tiles), size=sample_size, replace=False)
+        review_df = labeled_tiles.iloc[row_idx, col_idx]
+    else:
+        review_df = labeled_tiles.iloc[:, col_idx]
     
     # Sort by confidence (lowest first for review)
-    review_df = review_df.sort_values('label_confidence')
+    review_df = review_df.sort_values('label_confidence').reset_index(drop=True)
     
     # Save
-    review_df.to_csv(output_path, index=False)
+    suffix = Path(output_path).suffix.lower()
+    if suffix == '.feather':
+        review_df.to_feather(output_path)
+    elif suffix == '.parquet':
+        review_df.to_parquet(output_path, index=False)
+    else:
+        review_df.to_csv(output_path, index=False)
     logger.info(f"Exported {len(review_df)} tiles for review to {output_path}")
@@ -6,7 +6,8 @@ with their morphological characteristics and analysis parameters.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+import functools
+from typing import Dict, FrozenSet, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -153,6 +154,28 @@ SPECIES_REGISTRY = {
 }
 
 
+# Per-species label sets and labelmaps derived from the registry
+SPECIES_VALID_LABELS: Dict[str, FrozenSet[str]] = {}
+SPECIES_LABELMAPS: Dict[str, Dict[int, str]] = {}
+
+
+def _build_label_caches():
+    """Populate SPECIES_VALID_LABELS and SPECIES_LABELMAPS from the registry."""
+    SPECIES_VALID_LABELS.clear()
+    SPECIES_LABELMAPS.clear()
+    
+    for code, info in SPECIES_REGISTRY.items():
+        SPECIES_VALID_LABELS[code] = frozenset(info.typical_follicle_types) | {"background"}
+        
+        labelmap = {0: "background"}
+        for idx, follicle_type in enumerate(info.typical_follicle_types, start=1):
+            labelmap[idx] = follicle_type
+        SPECIES_LABELMAPS[code] = labelmap
+
+
+_build_label_caches()
+
+
 def get_species_info(species_code: str) -> Optional[SpeciesInfo]:
     """
     Get information about a species.
@@ -241,11 +264,24 @@ def get_species_labelmap(species_code: str) -> Dict[int, str]:
     if not info:
         return {}
     
-    labelmap = {0: "background"}
-    for idx, follicle_type in enumerate(info.typical_follicle_types, start=1):
-        labelmap[idx] = follicle_type
+    return SPECIES_LABELMAPS[species_code.lower()].copy()
+
+
+def get_valid_labels(species_code: str) -> FrozenSet[str]:
+    """
+    Get the set of valid tile labels for a species.
+    
+    Args:
+        species_code: Species code
+        
+    Returns:
+        Frozen set of follicle type names plus 'background'
+    """
+    info = get_species_info(species_code)
+    if not info:
+        return frozenset()
     
-    return labelmap
+    return SPECIES_VALID_LABELS[species_code.lower()]
 
 
 def compare_species(species_codes: List[str]) -> Dict:
@@ -288,6 +324,7 @@ def register_custom_species(species_code: str, species_info: SpeciesInfo):
         logger.warning(f"Overwriting existing species: {species_code}")
     
     SPECIES_REGISTRY[species_code] = species_info
+    _refresh_lookup_caches()
     logger.info(f"Registered custom species: {species_code}")
 
 
@@ -308,6 +345,42 @@ SPECIES_ALIASES = {
 }
 
 
+def _build_normalized_lookup() -> Dict[str, str]:
+    """
+    Build a mapping from every normalized species name form to its code.
+    
+    Entries are inserted from lowest to highest priority (names, then
+    aliases, then codes) so that later inserts win on collisions.
+    
+    Returns:
+        Dictionary mapping normalized names to species codes
+    """
+    lookup = {}
+    
+    # Scientific and common names (earlier registry entries win)
+    for code, info in reversed(list(SPECIES_REGISTRY.items())):
+        lookup[info.common_name.lower().replace(" ", "_")] = code
+        lookup[info.scientific_name.lower().replace(" ", "_")] = code
+    
+    lookup.update(SPECIES_ALIASES)
+    lookup.update({code: code for code in SPECIES_REGISTRY})
+    
+    return lookup
+
+
+# Normalized name/alias/code -> species code, refreshed on registration
+NORMALIZED_LOOKUP = _build_normalized_lookup()
+
+
+def _refresh_lookup_caches():
+    """Rebuild lookup tables and clear memoized lookups after a registry change."""
+    _build_label_caches()
+    NORMALIZED_LOOKUP.clear()
+    NORMALIZED_LOOKUP.update(_build_normalized_lookup())
+    resolve_species_code.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
 def resolve_species_code(name: str) -> Optional[str]:
     """
     Resolve various species name formats to standard code.
@@ -319,20 +392,4 @@ def resolve_species_code(name: str) -> Optional[str]:
         Standardized species code or None
     """
     name_lower = name.lower().replace(" ", "_").replace("-", "_")
-    
-    # Check if it's already a valid code
-    if name_lower in SPECIES_REGISTRY:
-        return name_lower
-    
-    # Check aliases
-    if name_lower in SPECIES_ALIASES:
-        return SPECIES_ALIASES[name_lower]
-    
-    # Check scientific names
-    for code, info in SPECIES_REGISTRY.items():
-        if info.scientific_name.lower().replace(" ", "_") == name_lower:
-            return code
-        if info.common_name.lower().replace(" ", "_") == name_lower:
-            return code
-    
-    return None
+    return NORMALIZED_LOOKUP.get(name_lower)